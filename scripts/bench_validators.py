@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Benchmark compiled request validators against a generic JSON-schema validator.
+
+Compiles the trading and report schemas with compile_validators.py into a
+temporary directory, checks that both validators agree on a set of realistic
+order payloads, then reports validations per second for each.
+
+The generic side uses the jsonschema package if it is installed; without it
+only the compiled validators are timed. jsonschema runs without a format
+checker, so the compiled side also does the int64 and date-time checks the
+generic side skips.
+
+Usage:
+    python3 scripts/bench_validators.py [-n SECONDS]
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import tempfile
+import time
+
+from compile_validators import DEFAULT_SCHEMAS, SCHEMAS_DIR, compile_schema, module_name
+
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+def order(i):
+    """A limit order as sent by the order gateway."""
+    return {
+        'type': 'ORDER_TYPE_LIMIT',
+        'side': 'SIDE_BUY' if i % 2 else 'SIDE_SELL',
+        'orderQty': str(100 + i),
+        'symbol': 'tec-nfl-sbw-2026-02-08-kc',
+        'price': str(450 + i % 50),
+        'timeInForce': 'TIME_IN_FORCE_GOOD_TILL_CANCEL',
+        'clordId': 'clord-%08d' % i,
+        'account': 'firm-a/trader-1',
+        'participateDontInitiate': i % 3 == 0,
+        'selfMatchPreventionInstruction': 'SELF_MATCH_PREVENTION_INSTRUCTION_CANCEL_RESTING',
+        'orderCapacity': 'ORDER_CAPACITY_AGENCY',
+        'manualOrderIndicator': 'MANUAL_ORDER_INDICATOR_AUTOMATED',
+    }
+
+# (schema file, operationId, payload)
+CASES = [
+    ('trading-schema.json', 'OrderEntryAPI_InsertOrder', order(1)),
+    ('trading-schema.json', 'OrderEntryAPI_InsertOrderList',
+     {'requests': [order(i) for i in range(20)]}),
+    ('trading-schema.json', 'OrderEntryAPI_CancelReplaceOrder', {
+        'orderId': '9f1c2a7e', 'clordId': 'clord-00000002', 'symbol': 'tec-nfl-sbw-2026-02-08-kc',
+        'orderQty': '150', 'price': '470', 'timeInForce': 'TIME_IN_FORCE_DAY',
+    }),
+    ('trading-schema.json', 'OrderEntryAPI_CancelOrder', {
+        'orderId': '9f1c2a7e', 'clordId': 'clord-00000003', 'symbol': 'tec-nfl-sbw-2026-02-08-kc',
+    }),
+    ('report-schema.json', 'ReportAPI_SearchOrders', {
+        'pageSize': 100, 'symbol': 'tec-nfl-sbw-2026-02-08-kc', 'accounts': ['firm-a/trader-1'],
+        'startTime': '2026-02-01T00:00:00Z', 'endTime': '2026-02-08T23:59:59.999Z',
+        'side': 'SIDE_BUY', 'orderStateFilter': 'ORDER_STATE_FILTER_OPEN',
+        'startTransactTradeDate': {'year': 2026, 'month': 2, 'day': 1},
+    }),
+]
+
+# Payloads the compiled validators must reject: (schema file, operationId, payload)
+INVALID = [
+    ('trading-schema.json', 'OrderEntryAPI_InsertOrder', dict(order(1), side='BUY')),
+    ('trading-schema.json', 'OrderEntryAPI_InsertOrder', dict(order(1), orderQty=100)),
+    ('trading-schema.json', 'OrderEntryAPI_InsertOrderList',
+     {'requests': [order(0), dict(order(1), allOrNone='yes')]}),
+    ('report-schema.json', 'ReportAPI_SearchOrders', {'startTransactTradeDate': {'year': '2026'}}),
+    # Non-ASCII digits and out-of-range date-time fields
+    ('trading-schema.json', 'OrderEntryAPI_InsertOrder', dict(order(1), orderQty='\u0661\u0662\u0663')),
+    ('report-schema.json', 'ReportAPI_SearchOrders',
+     {'startTime': '\u0662\u0660\u0662\u0666-01-01T00:00:00Z'}),
+    ('report-schema.json', 'ReportAPI_SearchOrders', {'startTime': '2026-13-45T99:99:99Z'}),
+    ('report-schema.json', 'ReportAPI_SearchOrders', {'startTime': '2026-02-30T00:00:00Z'}),
+]
+
+def load_compiled(directory):
+    """Compile each schema into ``directory`` and import the result."""
+    modules = {}
+    for schema in DEFAULT_SCHEMAS:
+        name = module_name(schema)
+        target = os.path.join(directory, name + '.py')
+        with open(target, 'w') as f:
+            f.write(compile_schema(os.path.join(SCHEMAS_DIR, schema)))
+        spec = importlib.util.spec_from_file_location(name, target)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        modules[schema] = module
+    return modules
+
+def load_generic(schema, operation_id):
+    """Build a jsonschema validator for one operation's request body."""
+    with open(os.path.join(SCHEMAS_DIR, schema)) as f:
+        spec = json.load(f)
+    for operations in spec['paths'].values():
+        for operation in operations.values():
+            if operation.get('operationId') == operation_id:
+                body = operation['requestBody']['content']['application/json']['schema']
+                root = dict(body, components=spec['components'])
+                return jsonschema.Draft7Validator(root).validate
+    raise KeyError(operation_id)
+
+def rate(validate, payload, seconds):
+    """Return validations per second over roughly ``seconds`` of wall time."""
+    calls, batch = 0, 100
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(batch):
+            validate(payload)
+        calls += batch
+    return calls / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--seconds', type=float, default=0.5,
+                        help='time spent on each validator per case (default: 0.5)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        modules = load_compiled(directory)
+
+        for schema, operation_id, payload in INVALID:
+            validate = modules[schema].REQUEST_VALIDATORS[operation_id]
+            try:
+                validate(payload)
+            except modules[schema].ValidationError:
+                continue
+            raise SystemExit('Compiled validator accepted an invalid %s payload' % operation_id)
+
+        if jsonschema is None:
+            print('jsonschema is not installed; timing compiled validators only.\n')
+        print('%-36s %16s %16s %8s' % ('Operation', 'compiled/s', 'jsonschema/s', 'speedup'))
+        for schema, operation_id, payload in CASES:
+            compiled = modules[schema].REQUEST_VALIDATORS[operation_id]
+            compiled(payload)
+            compiled_rate = rate(compiled, payload, args.seconds)
+            if jsonschema is None:
+                print('%-36s %16.0f %16s %8s' % (operation_id, compiled_rate, '-', '-'))
+                continue
+            generic = load_generic(schema, operation_id)
+            generic(payload)
+            generic_rate = rate(generic, payload, args.seconds)
+            print('%-36s %16.0f %16.0f %7.1fx' % (
+                operation_id, compiled_rate, generic_rate, compiled_rate / generic_rate))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""Compile OpenAPI request schemas into importable Python validator modules.
+
+Each request body schema reachable from the spec's operations is turned into
+a plain Python function, with every $ref resolved at compile time. Objects
+become functions, and enums and primitives are inlined as type and format
+checks. The generated modules only need the standard library.
+
+Usage:
+    python3 scripts/compile_validators.py
+    python3 scripts/compile_validators.py path/to/schema.json -o build/validators
+
+Then, with the output directory on sys.path:
+    from trading_validators import REQUEST_VALIDATORS, ValidationError
+    REQUEST_VALIDATORS['OrderEntryAPI_InsertOrder'](payload)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+
+SCHEMAS_DIR = os.path.join(os.path.dirname(__file__), '..', 'api-reference', 'oapi-schemas')
+OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'build', 'validators')
+DEFAULT_SCHEMAS = ['trading-schema.json', 'report-schema.json']
+
+REF_PREFIX = '#/components/schemas/'
+
+MODULE_HEADER = '''"""Request validators for %(title)s.
+
+Generated by scripts/compile_validators.py from %(source)s. Do not edit.
+"""
+
+import calendar
+import re
+
+SCHEMA_SHA256 = %(digest)r
+
+_MISSING = object()
+_INT64 = re.compile(r'-?[0-9]{1,19}\\Z')
+_DATE_TIME = re.compile(
+    r'([0-9]{4})-([0-9]{2})-([0-9]{2})[Tt ]([0-9]{2}):([0-9]{2}):([0-9]{2})(\\.[0-9]+)?'
+    r'(?:[Zz]|[+-]([0-9]{2}):([0-9]{2}))\\Z')
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_date_time(value):
+    """Check an RFC 3339 date-time, including field ranges."""
+    match = _DATE_TIME.match(value)
+    if match is None:
+        return False
+    year, month, day, hour, minute, second, _, offset_hour, offset_minute = match.groups()
+    month = int(month)
+    if not 1 <= month <= 12:
+        return False
+    days = _DAYS_IN_MONTH[month] + (month == 2 and calendar.isleap(int(year)))
+    return (1 <= int(day) <= days and int(hour) <= 23 and int(minute) <= 59
+            and int(second) <= 60  # 60 allows a leap second
+            and (offset_hour is None or (int(offset_hour) <= 23 and int(offset_minute) <= 59)))
+
+
+class ValidationError(ValueError):
+    """Raised when a payload does not match its schema."""
+
+    def __init__(self, message, path):
+        ValueError.__init__(self, message)
+        self.message = message
+        self.path = path
+
+    def __str__(self):
+        location = '$' + ''.join(
+            '[%%d]' %% p if isinstance(p, int) else '.' + p for p in self.path)
+        return '%%s: %%s' %% (location, self.message)
+'''
+
+def schema_name(ref):
+    """Return the component name a local $ref points at."""
+    if not ref.startswith(REF_PREFIX):
+        raise ValueError('Unsupported $ref: %s' % ref)
+    return ref[len(REF_PREFIX):]
+
+def identifier(text):
+    """Turn a schema or property name into a Python identifier fragment."""
+    return re.sub(r'\W', '_', text)
+
+class ValidatorCompiler:
+    """Generate Python source for the request schemas of one OpenAPI spec."""
+
+    def __init__(self, spec):
+        self.schemas = spec.get('components', {}).get('schemas', {})
+        self.functions = []     # Generated function sources, in order
+        self.constants = []     # Module-level constants (enum sets, key sets)
+        self.constant_names = {}  # Constant source -> name, to share duplicates
+        self.compiled = {}      # Component name -> function name
+        self.pending = []       # (function name, schema) still to compile
+
+    def resolve(self, schema):
+        """Follow $refs until reaching a concrete schema."""
+        seen = set()
+        while '$ref' in schema:
+            name = schema_name(schema['$ref'])
+            if name in seen:
+                raise ValueError('Circular $ref alias: %s' % name)
+            seen.add(name)
+            schema = self.schemas[name]
+        return schema
+
+    def is_object(self, schema):
+        return schema.get('type') == 'object' or 'properties' in schema
+
+    def function_for(self, name):
+        """Return the validator function name for a component, queueing it."""
+        if name not in self.compiled:
+            self.compiled[name] = 'validate_' + identifier(name)
+            self.pending.append((self.compiled[name], self.schemas[name]))
+        return self.compiled[name]
+
+    def constant(self, prefix, value):
+        """Register a module-level constant and return its name."""
+        if value not in self.constant_names:
+            name = '_%s_%d' % (prefix, len(self.constants))
+            self.constants.append('%s = %s' % (name, value))
+            self.constant_names[value] = name
+        return self.constant_names[value]
+
+    def compile_operations(self, paths):
+        """Compile every JSON request body and return {operationId: function}."""
+        validators = {}
+        for path, operations in sorted(paths.items()):
+            for method, operation in sorted(operations.items()):
+                if not isinstance(operation, dict):
+                    continue
+                content = operation.get('requestBody', {}).get('content', {})
+                schema = content.get('application/json', {}).get('schema')
+                if schema is None or 'operationId' not in operation:
+                    continue
+                if '$ref' in schema:
+                    function = self.function_for(schema_name(schema['$ref']))
+                else:
+                    function = '_validate_%s_body' % identifier(operation['operationId'])
+                    self.pending.append((function, schema))
+                validators[operation['operationId']] = function
+        while self.pending:
+            function, schema = self.pending.pop(0)
+            self.compile_function(function, self.resolve(schema))
+        return validators
+
+    def compile_function(self, function, schema):
+        """Emit a validator function for an object (or any other) schema."""
+        lines = ['def %s(data):' % function]
+        if not self.is_object(schema):
+            self.emit_check(schema, 'data', [], lines, 1, function)
+            lines.append('    return data')
+            self.functions.append('\n'.join(lines))
+            return
+
+        lines.append('    if type(data) is not dict:')
+        lines.append("        raise ValidationError('expected object', [])")
+        properties = schema.get('properties', {})
+        for key in schema.get('required', []):
+            lines.append('    if %r not in data:' % key)
+            lines.append("        raise ValidationError('missing required property', [%r])" % key)
+        if properties:
+            lines.append('    get = data.get')
+        for key, prop in properties.items():
+            body = []
+            self.emit_check(prop, 'value', [repr(key)], body, 2,
+                            '_%s_%s' % (function.lstrip('_'), identifier(key)))
+            if body:
+                lines.append('    value = get(%r, _MISSING)' % key)
+                lines.append('    if value is not _MISSING:')
+                lines.extend(body)
+
+        additional = schema.get('additionalProperties', True)
+        if additional is not True and additional != {}:
+            known = self.constant('KEYS', 'frozenset(%r)' % sorted(properties))
+            lines.append('    for key, value in data.items():')
+            lines.append('        if key in %s:' % known)
+            lines.append('            continue')
+            if additional is False:
+                lines.append("        raise ValidationError('unexpected property', [key])")
+            else:
+                body = []
+                self.emit_check(additional, 'value', ['key'], body, 2,
+                                '_%s_additional' % function.lstrip('_'))
+                lines.extend(body or ['        pass'])
+        lines.append('    return data')
+        self.functions.append('\n'.join(lines))
+
+    def emit_check(self, schema, var, path, lines, depth, hint):
+        """Append statements that validate ``var`` against ``schema``.
+
+        ``path`` holds Python expressions for the location of ``var`` relative
+        to the enclosing function, used when raising ValidationError.
+        """
+        pad = '    ' * depth
+        location = '[%s]' % ', '.join(path)
+
+        if '$ref' in schema:
+            name = schema_name(schema['$ref'])
+            target = self.resolve(schema)
+            if self.is_object(target):
+                self.emit_call(self.function_for(name), var, path, lines, depth)
+            else:
+                self.emit_check(target, var, path, lines, depth, hint)
+            return
+
+        if schema.get('nullable'):
+            body = []
+            self.emit_check(dict(schema, nullable=False), var, path, body, depth + 1, hint)
+            if body:
+                lines.append('%sif %s is not None:' % (pad, var))
+                lines.extend(body)
+            return
+
+        kind = schema.get('type')
+        fmt = schema.get('format')
+        if 'enum' in schema:
+            values = schema['enum']
+            if all(isinstance(v, str) for v in values):
+                members = self.constant('ENUM', 'frozenset(%r)' % sorted(values))
+                condition = 'type(%s) is not str or %s not in %s' % (var, var, members)
+            else:
+                members = self.constant('ENUM', repr(tuple(values)))
+                condition = '%s not in %s' % (var, members)
+            message = 'must be one of %s' % ', '.join(str(v) for v in values)
+            if len(message) > 200:
+                message = message[:197] + '...'
+            self.emit_raise(condition, message, location, lines, depth)
+        elif kind == 'string':
+            condition = 'type(%s) is not str' % var
+            if fmt == 'int64':
+                condition += (' or _INT64.match(%s) is None or (len(%s) > 18 and not '
+                              '-9223372036854775808 <= int(%s) <= 9223372036854775807)'
+                              % (var, var, var))
+                message = 'expected int64 string'
+            elif fmt == 'date-time':
+                condition += ' or not _is_date_time(%s)' % var
+                message = 'expected RFC 3339 date-time string'
+            else:
+                message = 'expected string'
+            self.emit_raise(condition, message, location, lines, depth)
+        elif kind == 'integer':
+            condition = 'type(%s) is not int' % var
+            if fmt == 'int32':
+                condition += ' or not -2147483648 <= %s <= 2147483647' % var
+                message = 'expected int32'
+            else:
+                message = 'expected integer'
+            self.emit_raise(condition, message, location, lines, depth)
+        elif kind == 'number':
+            self.emit_raise('type(%s) is not int and type(%s) is not float' % (var, var),
+                            'expected number', location, lines, depth)
+        elif kind == 'boolean':
+            self.emit_raise('type(%s) is not bool' % var, 'expected boolean',
+                            location, lines, depth)
+        elif kind == 'array':
+            self.emit_raise('type(%s) is not list' % var, 'expected array',
+                            location, lines, depth)
+            index, item = 'i%d' % depth, 'item%d' % depth
+            body = []
+            self.emit_check(schema.get('items', {}), item, path + [index], body, depth + 1,
+                            hint + '_item')
+            if body:
+                lines.append('%sfor %s, %s in enumerate(%s):' % (pad, index, item, var))
+                lines.extend(body)
+        elif self.is_object(schema):
+            if 'properties' in schema or 'additionalProperties' in schema:
+                self.pending.append((hint, schema))
+                self.emit_call(hint, var, path, lines, depth)
+            else:
+                self.emit_raise('type(%s) is not dict' % var, 'expected object',
+                                location, lines, depth)
+
+    def emit_raise(self, condition, message, location, lines, depth):
+        pad = '    ' * depth
+        lines.append('%sif %s:' % (pad, condition))
+        lines.append('%s    raise ValidationError(%r, %s)' % (pad, message, location))
+
+    def emit_call(self, function, var, path, lines, depth):
+        """Call a nested validator, prefixing its error path with ours."""
+        pad = '    ' * depth
+        lines.append('%stry:' % pad)
+        lines.append('%s    %s(%s)' % (pad, function, var))
+        lines.append('%sexcept ValidationError as e:' % pad)
+        lines.append('%s    e.path[:0] = [%s]' % (pad, ', '.join(path)))
+        lines.append('%s    raise' % pad)
+
+def compile_schema(path):
+    """Return the source of a validator module for one OpenAPI spec."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    spec = json.loads(raw)
+    compiler = ValidatorCompiler(spec)
+    validators = compiler.compile_operations(spec.get('paths', {}))
+
+    parts = [MODULE_HEADER.rstrip() % {
+        'title': spec.get('info', {}).get('title', os.path.basename(path)),
+        'source': os.path.basename(path),
+        'digest': hashlib.sha256(raw).hexdigest(),
+    }]
+    if compiler.constants:
+        parts.append('\n'.join(compiler.constants))
+    parts.extend(compiler.functions)
+    mapping = ''.join('    %r: %s,\n' % item for item in sorted(validators.items()))
+    parts.append('# operationId -> request body validator\nREQUEST_VALIDATORS = {\n%s}' % mapping)
+    return '\n\n\n'.join(parts) + '\n'
+
+def module_name(path):
+    """Map e.g. trading-schema.json to trading_validators."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if stem.endswith('-schema'):
+        stem = stem[:-len('-schema')]
+    return identifier(stem) + '_validators'
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('schemas', nargs='*',
+                        default=[os.path.join(SCHEMAS_DIR, s) for s in DEFAULT_SCHEMAS],
+                        help='OpenAPI JSON files (default: trading and report schemas)')
+    parser.add_argument('-o', '--output', default=OUTPUT_DIR, help='output directory')
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    for schema in args.schemas:
+        target = os.path.join(args.output, module_name(schema) + '.py')
+        with open(target, 'w') as f:
+            f.write(compile_schema(schema))
+        print('Created: %s' % os.path.relpath(target))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Extract filled-in onboarding forms into JSON records.
+
+Reads the content controls tagged by generate_word_docs.py straight out of
+word/document.xml with a streaming parser, so python-docx is not needed.
+Prints one JSON record per form (JSON Lines).
+
+Only forms returned as the Word files from generate_word_docs.py can be
+read. The forms in the published Polymarket_Onboarding_Templates.zip carry
+no content controls, and Google Docs drops them when a form is copied into
+a Google Document, so forms returned either way are reported with
+"no tagged fields found" and need re-keying by hand.
+
+Usage:
+    python3 scripts/extract_form_data.py returned/*.docx > records.jsonl
+    python3 scripts/extract_form_data.py returned/ -o records.jsonl
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import json
+import os
+import re
+import sys
+import xml.etree.ElementTree as ET
+import zipfile
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+SDT = W + 'sdt'
+SDT_PR = W + 'sdtPr'
+SDT_CONTENT = W + 'sdtContent'
+TAG = W + 'tag'
+TEXT = W + 't'
+TAB = W + 'tab'
+PARAGRAPH = W + 'p'
+VAL = W + 'val'
+
+CHECKBOX = re.compile(r'^\[\s*(\S?)\s*\]$')
+OPTION = re.compile(r'\[\s*(\S?)\s*\]\s*([^\[]*)')
+
+def parse_value(text):
+    """Turn the raw text of a field into a JSON value.
+
+    A lone checkbox becomes a boolean, a cell of inline options such as
+    ``[X] Email  [ ] Phone`` becomes the list of checked options, and
+    anything else is returned as stripped text.
+    """
+    text = text.strip()
+    match = CHECKBOX.match(text)
+    if match:
+        return bool(match.group(1))
+    if text.startswith('['):
+        options = OPTION.findall(text)
+        if len(options) > 1:
+            return [label.strip() for mark, label in options if mark]
+    return text
+
+def iter_fields(stream):
+    """Yield (field id, raw text) for each tagged content control."""
+    tag = None
+    depth = 0  # Nesting depth of w:sdt elements
+    in_content = False
+    parts = []
+    for event, elem in ET.iterparse(stream, events=('start', 'end')):
+        if event == 'start':
+            if elem.tag == SDT:
+                depth += 1
+            elif elem.tag == SDT_CONTENT and depth == 1:
+                in_content = True
+            continue
+        if elem.tag == TAG and depth == 1:
+            tag = elem.get(VAL)
+        elif in_content and elem.tag == TEXT:
+            parts.append(elem.text or '')
+        elif in_content and elem.tag == TAB:
+            parts.append('\t')
+        elif in_content and elem.tag == PARAGRAPH:
+            parts.append('\n')
+        elif elem.tag == SDT:
+            depth -= 1
+            if depth == 0:
+                if tag:
+                    yield tag, ''.join(parts)
+                tag = None
+                in_content = False
+                parts = []
+        if depth == 0:
+            elem.clear()
+
+def extract_form(path):
+    """Extract one returned form into a JSON-serializable record."""
+    record = {'source': path}
+    try:
+        with zipfile.ZipFile(path) as docx:
+            with docx.open('word/document.xml') as stream:
+                record['fields'] = {tag: parse_value(text) for tag, text in iter_fields(stream)}
+    except (OSError, KeyError, zipfile.BadZipFile, ET.ParseError) as e:
+        record['error'] = str(e)
+    else:
+        if not record['fields']:
+            record['error'] = 'no tagged fields found'
+    return record
+
+def find_forms(paths):
+    """Expand directories into the .docx files they contain."""
+    forms = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                forms.extend(os.path.join(root, f) for f in sorted(files)
+                             if f.endswith('.docx') and not f.startswith('~$'))
+        else:
+            forms.append(path)
+    return forms
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('paths', nargs='+', help='.docx files or directories of them')
+    parser.add_argument('-o', '--output', help='write JSON Lines here instead of stdout')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    forms = find_forms(args.paths)
+    out = open(args.output, 'w') if args.output else sys.stdout
+    failed = 0
+    try:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            chunksize = max(1, len(forms) // (4 * (args.jobs or os.cpu_count() or 1)))
+            for record in pool.map(extract_form, forms, chunksize=chunksize):
+                failed += 'error' in record
+                out.write(json.dumps(record) + '\n')
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print('Extracted %d form(s), %d failed' % (len(forms) - failed, failed), file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,16 +5,85 @@ from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+import argparse
+import io
 import os
+import re
+import zipfile
 
 DOWNLOADS_DIR = os.path.join(os.path.dirname(__file__), '..', 'downloads')
 
+# Forms bundle linked from the onboarding-template pages, rebuilt only with
+# --zip: archive name -> generated document. The published bundle holds
+# separately authored forms, so replacing it is a content change.
+TEMPLATES_ZIP = 'Polymarket_Onboarding_Templates.zip'
+TEMPLATES_ZIP_CONTENTS = [
+    ('Contact_Form.docx', 'contact-form.docx'),
+    ('Corporate_Application.docx', 'corporate-application.docx'),
+    ('Participant_Agreement.docx', 'participant-agreement.docx'),
+]
+# Fixed entry timestamp so rebuilding unchanged forms gives an identical zip
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# Field identifiers are stored in the w:tag of each content control, so keep
+# them short enough for Word's content control properties dialog.
+MAX_SLUG_LENGTH = 40
+
 def add_heading(doc, text, level=0):
     """Add a heading to the document."""
     doc.add_heading(text, level=level)
 
-def add_table(doc, headers, rows):
-    """Add a table with field/value pairs."""
+def slugify(text):
+    """Turn a heading or label into a stable identifier fragment."""
+    text = re.sub(r'^[\d.]+\s+', '', text)  # Drop section numbering
+    slug = re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_')
+    if len(slug) > MAX_SLUG_LENGTH:
+        slug = slug[:MAX_SLUG_LENGTH + 1].rsplit('_', 1)[0]  # Cut at a word boundary
+    return slug
+
+def current_section(doc):
+    """Return the slug of the most recent heading in the document."""
+    for paragraph in reversed(doc.paragraphs):
+        style = paragraph.style.name
+        if style == 'Title' or style.startswith('Heading'):
+            return slugify(paragraph.text)
+    return 'form'
+
+def field_id(doc, section, label):
+    """Build a field identifier that is unique within the document."""
+    base = '%s.%s' % (section, slugify(label))
+    used = set(doc.element.body.xpath('.//w:sdtPr/w:tag/@w:val'))
+    candidate, n = base, 1
+    while candidate in used:
+        n += 1
+        candidate = '%s_%d' % (base, n)
+    return candidate
+
+def tag_field(element, tag, label):
+    """Wrap a paragraph or run in a content control tagged with a field id."""
+    sdt = OxmlElement('w:sdt')
+    sdt_pr = OxmlElement('w:sdtPr')
+    alias = OxmlElement('w:alias')
+    alias.set(qn('w:val'), label)
+    sdt_pr.append(alias)
+    tag_el = OxmlElement('w:tag')
+    tag_el.set(qn('w:val'), tag)
+    sdt_pr.append(tag_el)
+    sdt_content = OxmlElement('w:sdtContent')
+    element.addprevious(sdt)
+    sdt_content.append(element)
+    sdt.append(sdt_pr)
+    sdt.append(sdt_content)
+
+def add_table(doc, headers, rows, section=None):
+    """Add a table with field/value pairs.
+
+    Each value cell is wrapped in a content control tagged with a field id
+    built from ``section`` (defaults to the current heading) and the label.
+    """
+    section = section or current_section(doc)
     table = doc.add_table(rows=len(rows)+1, cols=2)
     table.style = 'Table Grid'
 
@@ -30,18 +99,26 @@ def add_table(doc, headers, rows):
         row_cells = table.rows[i+1].cells
         row_cells[0].text = row[0]
         row_cells[1].text = row[1] if len(row) > 1 else ''
+        tag_field(row_cells[1].paragraphs[0]._p, field_id(doc, section, row[0]), row[0])
 
     doc.add_paragraph()  # Add spacing after table
 
 def add_checkbox_list(doc, items):
-    """Add a checkbox list."""
+    """Add a checkbox list, tagging each checkbox with a field id."""
+    section = current_section(doc)
     for item in items:
         p = doc.add_paragraph()
-        p.add_run('[ ] ').bold = True
+        box = p.add_run('[ ] ')
+        box.bold = True
         p.add_run(item)
+        tag_field(box._r, field_id(doc, section, item), item)
 
 def add_yes_no_table(doc, questions):
-    """Add a table with Yes/No columns."""
+    """Add a table with Yes/No columns.
+
+    The Yes and No cells are tagged ``<field id>.yes`` and ``<field id>.no``.
+    """
+    section = current_section(doc)
     table = doc.add_table(rows=len(questions)+1, cols=3)
     table.style = 'Table Grid'
 
@@ -56,9 +133,67 @@ def add_yes_no_table(doc, questions):
         table.rows[i+1].cells[0].text = q
         table.rows[i+1].cells[1].text = '[ ]'
         table.rows[i+1].cells[2].text = '[ ]'
+        question_id = field_id(doc, section, q)
+        tag_field(table.rows[i+1].cells[1].paragraphs[0]._p, question_id + '.yes', q)
+        tag_field(table.rows[i+1].cells[2].paragraphs[0]._p, question_id + '.no', q)
 
     doc.add_paragraph()
 
+def add_entry_table(doc, headers, count):
+    """Add a table of ``count`` blank rows to fill in, one column per header.
+
+    Each cell is tagged ``<section>.<row number>.<column>``.
+    """
+    section = current_section(doc)
+    table = doc.add_table(rows=count+1, cols=len(headers))
+    table.style = 'Table Grid'
+    for i, h in enumerate(headers):
+        table.rows[0].cells[i].text = h
+        table.rows[0].cells[i].paragraphs[0].runs[0].bold = True
+
+    for n in range(1, count+1):
+        for i, h in enumerate(headers):
+            cell = table.rows[n].cells[i]
+            tag_field(cell.paragraphs[0]._p, field_id(doc, '%s.%d' % (section, n), h), h)
+
+    doc.add_paragraph()
+
+def add_checkbox_grid(doc, headers, labels):
+    """Add a table with a checkbox per label and option column.
+
+    Each checkbox is tagged ``<field id>.<column>``.
+    """
+    section = current_section(doc)
+    table = doc.add_table(rows=len(labels)+1, cols=len(headers))
+    table.style = 'Table Grid'
+    for i, h in enumerate(headers):
+        table.rows[0].cells[i].text = h
+        table.rows[0].cells[i].paragraphs[0].runs[0].bold = True
+
+    for n, label in enumerate(labels):
+        row = table.rows[n+1]
+        row.cells[0].text = label
+        label_id = field_id(doc, section, label)
+        for i, h in enumerate(headers[1:], 1):
+            row.cells[i].text = '[ ]'
+            tag_field(row.cells[i].paragraphs[0]._p, '%s.%s' % (label_id, slugify(h)), label)
+
+    doc.add_paragraph()
+
+def add_yes_no_choice(doc, label, yes_text=' Yes', no_text=' No'):
+    """Add an inline ``[ ] Yes  [ ] No`` paragraph.
+
+    The boxes are tagged ``<field id>.yes`` and ``<field id>.no``.
+    """
+    question_id = field_id(doc, current_section(doc), label)
+    p = doc.add_paragraph()
+    yes = p.add_run('[ ]')
+    p.add_run(yes_text)
+    no = p.add_run('[ ]')
+    p.add_run(no_text)
+    tag_field(yes._r, question_id + '.yes', label)
+    tag_field(no._r, question_id + '.no', label)
+
 def create_onboarding_template():
     """Create the ISV Onboarding Document Template."""
     doc = Document()
@@ -204,7 +339,7 @@ def create_corporate_application():
         ['SSN/Tax ID (last 4 digits)', ''],
         ['Ownership Percentage', '%'],
         ['Address', ''],
-    ])
+    ], section='owner_1')
 
     doc.add_paragraph().add_run('Owner 2 (if applicable):').bold = True
     add_table(doc, ['Field', 'Value'], [
@@ -213,7 +348,7 @@ def create_corporate_application():
         ['SSN/Tax ID (last 4 digits)', ''],
         ['Ownership Percentage', '%'],
         ['Address', ''],
-    ])
+    ], section='owner_2')
 
     doc.add_paragraph().add_run('Owner 3 (if applicable):').bold = True
     add_table(doc, ['Field', 'Value'], [
@@ -222,7 +357,7 @@ def create_corporate_application():
         ['SSN/Tax ID (last 4 digits)', ''],
         ['Ownership Percentage', '%'],
         ['Address', ''],
-    ])
+    ], section='owner_3')
 
     doc.add_paragraph('Note: If no individual owns 25% or more, list the individual(s) with significant management responsibility (e.g., CEO, CFO, COO).')
 
@@ -253,14 +388,7 @@ def create_corporate_application():
     ])
 
     doc.add_heading('Board of Directors / Managing Members', 2)
-    table = doc.add_table(rows=4, cols=3)
-    table.style = 'Table Grid'
-    table.rows[0].cells[0].text = 'Name'
-    table.rows[0].cells[1].text = 'Title'
-    table.rows[0].cells[2].text = 'Email'
-    for cell in table.rows[0].cells:
-        cell.paragraphs[0].runs[0].bold = True
-    doc.add_paragraph()
+    add_entry_table(doc, ['Name', 'Title', 'Email'], 3)
 
     # 6. Business Information
     add_heading(doc, '6. Business Information', 1)
@@ -282,15 +410,9 @@ def create_corporate_application():
 
     doc.add_heading('7.1 Licenses and Registrations', 2)
     doc.add_paragraph('Does the entity hold any financial services licenses or registrations?')
-    doc.add_paragraph('[ ] Yes (complete table below)    [ ] No')
+    add_yes_no_choice(doc, 'Holds licenses or registrations', ' Yes (complete table below)    ')
 
-    table = doc.add_table(rows=3, cols=4)
-    table.style = 'Table Grid'
-    headers = ['License Type', 'Issuing Authority', 'License Number', 'Expiration Date']
-    for i, h in enumerate(headers):
-        table.rows[0].cells[i].text = h
-        table.rows[0].cells[i].paragraphs[0].runs[0].bold = True
-    doc.add_paragraph()
+    add_entry_table(doc, ['License Type', 'Issuing Authority', 'License Number', 'Expiration Date'], 2)
 
     doc.add_heading('7.2 Regulatory History', 2)
     doc.add_paragraph('Has the entity or any of its officers/directors ever been:')
@@ -465,36 +587,15 @@ def create_contact_form():
     add_heading(doc, '7. Notification Preferences', 1)
     doc.add_paragraph('How should we contact you for different types of communications?')
 
-    table = doc.add_table(rows=6, cols=4)
-    table.style = 'Table Grid'
-    headers = ['Communication Type', 'Email', 'Phone', 'SMS']
-    for i, h in enumerate(headers):
-        table.rows[0].cells[i].text = h
-        table.rows[0].cells[i].paragraphs[0].runs[0].bold = True
-
     comm_types = ['API Status Updates', 'Security Alerts', 'Maintenance Notifications', 'Product Updates', 'Billing/Invoices']
-    for i, ct in enumerate(comm_types):
-        table.rows[i+1].cells[0].text = ct
-        table.rows[i+1].cells[1].text = '[ ]'
-        table.rows[i+1].cells[2].text = '[ ]'
-        table.rows[i+1].cells[3].text = '[ ]'
-    doc.add_paragraph()
+    add_checkbox_grid(doc, ['Communication Type', 'Email', 'Phone', 'SMS'], comm_types)
 
     # 8. Distribution Lists
     add_heading(doc, '8. Distribution Lists', 1)
     doc.add_paragraph('Provide any shared email addresses for team communications:')
 
-    table = doc.add_table(rows=5, cols=2)
-    table.style = 'Table Grid'
-    table.rows[0].cells[0].text = 'Purpose'
-    table.rows[0].cells[1].text = 'Email Address'
-    for cell in table.rows[0].cells:
-        cell.paragraphs[0].runs[0].bold = True
-
     purposes = ['Technical/Engineering', 'Operations', 'Compliance', 'Executive']
-    for i, p in enumerate(purposes):
-        table.rows[i+1].cells[0].text = p
-    doc.add_paragraph()
+    add_table(doc, ['Purpose', 'Email Address'], [[p, ''] for p in purposes])
 
     # 9. Acknowledgements
     add_heading(doc, '9. Acknowledgements', 1)
@@ -745,11 +846,53 @@ def create_getting_started_onboarding():
     doc.save(os.path.join(DOWNLOADS_DIR, 'partner-onboarding-template.docx'))
     print('Created: partner-onboarding-template.docx')
 
+def zip_bytes(members):
+    """Deflate (name, data) pairs into zip bytes with fixed entry timestamps."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, data in members:
+            info = zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            archive.writestr(info, data)
+    return buffer.getvalue()
+
+def create_templates_zip():
+    """Bundle the partner forms into the zip the docs link to.
+
+    python-docx stamps every part with the current time, so each form is
+    repacked with fixed timestamps and the zip is only rewritten when its
+    bytes change.
+    """
+    forms = []
+    for archive_name, generated in TEMPLATES_ZIP_CONTENTS:
+        with zipfile.ZipFile(os.path.join(DOWNLOADS_DIR, generated)) as docx:
+            parts = [(info.filename, docx.read(info)) for info in docx.infolist()]
+        forms.append((archive_name, zip_bytes(parts)))
+    data = zip_bytes(forms)
+
+    path = os.path.join(DOWNLOADS_DIR, TEMPLATES_ZIP)
+    if os.path.isfile(path):
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                print('Unchanged: ' + TEMPLATES_ZIP)
+                return
+    with open(path, 'wb') as f:
+        f.write(data)
+    print('Created: ' + TEMPLATES_ZIP)
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--zip', action='store_true',
+                        help='also rebuild %s from the generated forms' % TEMPLATES_ZIP)
+    args = parser.parse_args()
+
     os.makedirs(DOWNLOADS_DIR, exist_ok=True)
     create_onboarding_template()
     create_corporate_application()
     create_contact_form()
     create_participant_agreement()
     create_getting_started_onboarding()
+    if args.zip:
+        create_templates_zip()
     print('\nAll Word documents created successfully!')
@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""Report page weight for every page in the docs.json navigation.
+
+For each page this totals the MDX source, the OpenAPI schema the page embeds,
+the local images it references, the site-wide logo and favicon, and any
+local downloads it links to. Pages over the budget are flagged. Downloads
+only count towards the budget with --count-downloads.
+
+It also checks every image in the repo for byte-identical duplicates and
+estimates how much lossless re-encoding would save. PNGs are re-encoded in
+pure Python and SVGs are minified. Estimates are cached by asset SHA-256,
+so unchanged images are not re-encoded on the next run.
+
+Usage:
+    python3 scripts/page_weight.py [--budget KB] [--count-downloads] [--json]
+"""
+
+from collections import defaultdict
+import argparse
+import hashlib
+import json
+import os
+import re
+import struct
+import sys
+import zlib
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+CACHE_FILE = os.path.join(ROOT, 'build', 'page-weight-cache.json')
+# Bump when the estimators change so cached results are recomputed
+CACHE_VERSION = 3
+DEFAULT_BUDGET_KB = 250
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.ico')
+SKIP_DIRS = ('.git', '.idea', 'build', 'node_modules')
+
+LINK = re.compile(r'\]\(\s*<?([^)\s>]+)')
+ATTRIBUTE = re.compile(r'\b(?:src|href)=["\']([^"\']+)["\']')
+FRONTMATTER = re.compile(r'\A---\s*\n(.*?)\n---', re.S)
+OPENAPI_KEY = re.compile(r'^openapi:\s*["\']?(.*?)["\']?\s*$', re.M)
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+
+# Ancillary PNG chunks that can be dropped without changing how the image renders
+PNG_STRIP_CHUNKS = (b'tEXt', b'zTXt', b'iTXt', b'tIME', b'eXIf', b'pHYs')
+PNG_CHANNELS = {0: 1, 2: 3, 4: 2, 6: 4}
+# Chunks rebuilt or dropped when re-encoding as a palette image, because their
+# layout depends on the colour type. bKGD and sBIT are hints browsers ignore.
+PNG_PALETTE_REBUILT_CHUNKS = (b'IHDR', b'IEND', b'PLTE', b'tRNS', b'bKGD', b'sBIT', b'hIST')
+
+# Smallest saving worth suggesting (also at least 1% of the file)
+MIN_SAVING_BYTES = 256
+
+def repo_path(ref):
+    """Map a site path like /logo/favicon.png to a file path."""
+    return os.path.join(ROOT, ref.lstrip('/'))
+
+def file_size(path):
+    return os.path.getsize(path) if os.path.isfile(path) else 0
+
+def sha256(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def openapi_source(value):
+    """Return the schema path from a navigation ``openapi`` value."""
+    if isinstance(value, dict):
+        value = value.get('source')
+    if isinstance(value, list):
+        value = value[0] if value else None
+    return value
+
+def schema_operations(source):
+    """List 'METHOD /path' for every operation in a JSON OpenAPI schema."""
+    path = repo_path(source)
+    if not path.endswith('.json'):
+        return [source]  # YAML schemas: report as one page
+    with open(path) as f:
+        spec = json.load(f)
+    return ['%s %s' % (method.upper(), route)
+            for route, operations in spec.get('paths', {}).items()
+            for method in operations if method in HTTP_METHODS]
+
+def iter_pages(node, openapi=None):
+    """Yield (page, schema source, is operation) for every navigation page.
+
+    MDX pages are yielded by slug. Operation pages generated from an
+    ``openapi`` group are yielded as 'METHOD /path' strings.
+    """
+    if isinstance(node, list):
+        for child in node:
+            for page in iter_pages(child, openapi):
+                yield page
+        return
+    if not isinstance(node, dict):
+        return
+    own = openapi_source(node.get('openapi'))
+    openapi = own or openapi
+    pages = node.get('pages')
+    for page in pages or []:
+        if isinstance(page, str):
+            yield page.lstrip('/'), openapi, False
+        else:
+            for child in iter_pages(page, openapi):
+                yield child
+    if own and pages is None:
+        for operation in schema_operations(own):
+            yield operation, own, True
+    for key, value in node.items():
+        if key not in ('pages', 'openapi') and isinstance(value, (list, dict)):
+            for page in iter_pages(value, openapi):
+                yield page
+
+def page_references(mdx_path, text):
+    """Return (local files, external image URLs) referenced by an MDX page."""
+    local, external = set(), set()
+    for ref in LINK.findall(text) + ATTRIBUTE.findall(text):
+        if ref.startswith(('http://', 'https://')):
+            if ref.lower().split('?')[0].endswith(IMAGE_EXTENSIONS):
+                external.add(ref)
+            continue
+        if ref.startswith(('mailto:', '#', '{')):
+            continue
+        ref = ref.split('#')[0].split('?')[0]
+        if not os.path.splitext(ref)[1]:
+            continue  # Link to another docs page
+        candidates = [repo_path(ref)]
+        if not ref.startswith('/'):
+            candidates.insert(0, os.path.join(os.path.dirname(mdx_path), ref))
+        for candidate in candidates:
+            if os.path.isfile(candidate):
+                local.add(os.path.normpath(candidate))
+                break
+    return local, external
+
+def page_schema(text, inherited):
+    """Return the schema a page embeds via its frontmatter, if any."""
+    frontmatter = FRONTMATTER.match(text)
+    if not frontmatter:
+        return None
+    match = OPENAPI_KEY.search(frontmatter.group(1))
+    if not match:
+        return None
+    first = match.group(1).split()[0] if match.group(1).split() else ''
+    if first.endswith(('.json', '.yaml', '.yml')):
+        return first
+    return inherited
+
+def site_assets(config):
+    """Return the logo and favicon files loaded on every page."""
+    assets = set()
+    for key in ('logo', 'favicon'):
+        value = config.get(key)
+        refs = value.values() if isinstance(value, dict) else [value]
+        for ref in refs:
+            if isinstance(ref, str) and os.path.isfile(repo_path(ref)):
+                assets.add(os.path.normpath(repo_path(ref)))
+    return assets
+
+def analyze_pages(config, count_downloads=False):
+    """Return (one weight record per navigation page, referenced asset paths)."""
+    chrome = site_assets(config)
+    chrome_bytes = sum(file_size(p) for p in chrome)
+    referenced = set(chrome)
+    records = []
+    seen = set()
+    for page, schema, is_operation in iter_pages(config.get('navigation', {})):
+        if (page, schema) in seen:
+            continue
+        seen.add((page, schema))
+        record = {'page': page, 'mdx': 0, 'schema': 0, 'images': 0, 'downloads': 0,
+                  'site_assets': chrome_bytes, 'external_images': 0}
+        if is_operation:
+            record['schema'] = file_size(repo_path(schema))
+            record['source'] = schema
+        else:
+            mdx_path = repo_path(page + '.mdx')
+            record['source'] = os.path.relpath(mdx_path, ROOT)
+            if not os.path.isfile(mdx_path):
+                record['missing'] = True
+            else:
+                with open(mdx_path, encoding='utf-8') as f:
+                    text = f.read()
+                record['mdx'] = len(text.encode('utf-8'))
+                embedded = page_schema(text, schema)
+                if embedded:
+                    record['schema'] = file_size(repo_path(embedded))
+                local, external = page_references(mdx_path, text)
+                referenced |= local
+                for path in local - chrome:
+                    kind = 'images' if path.lower().endswith(IMAGE_EXTENSIONS) else 'downloads'
+                    record[kind] += file_size(path)
+                record['external_images'] = len(external)
+        record['total'] = (record['mdx'] + record['schema'] + record['images']
+                           + record['site_assets']
+                           + (record['downloads'] if count_downloads else 0))
+        records.append(record)
+    return records, referenced
+
+def read_png(data):
+    """Split a PNG into (IHDR fields, [(chunk type, body)])."""
+    if data[:8] != b'\x89PNG\r\n\x1a\n':
+        raise ValueError('not a PNG')
+    chunks, i = [], 8
+    while i < len(data):
+        length, kind = struct.unpack('>I4s', data[i:i + 8])
+        chunks.append((kind, data[i + 8:i + 8 + length]))
+        i += 12 + length
+    header = struct.unpack('>IIBBBBB', chunks[0][1])
+    return header, chunks
+
+def png_size(chunks):
+    """Byte size of a PNG built from the given chunks."""
+    return 8 + sum(12 + len(body) for _, body in chunks)
+
+def unfilter(raw, width, height, bpp):
+    """Undo PNG scanline filtering, returning the raw pixel bytes."""
+    stride = width * bpp
+    out = bytearray()
+    prev = bytearray(stride)
+    i = 0
+    for _ in range(height):
+        kind = raw[i]
+        line = bytearray(raw[i + 1:i + 1 + stride])
+        i += 1 + stride
+        if kind == 1:
+            for x in range(bpp, stride):
+                line[x] = (line[x] + line[x - bpp]) & 255
+        elif kind == 2:
+            line = bytearray((a + b) & 255 for a, b in zip(line, prev))
+        elif kind == 3:
+            for x in range(stride):
+                left = line[x - bpp] if x >= bpp else 0
+                line[x] = (line[x] + ((left + prev[x]) >> 1)) & 255
+        elif kind == 4:
+            for x in range(stride):
+                a = line[x - bpp] if x >= bpp else 0
+                b = prev[x]
+                c = prev[x - bpp] if x >= bpp else 0
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                predictor = a if pa <= pb and pa <= pc else b if pb <= pc else c
+                line[x] = (line[x] + predictor) & 255
+        out += line
+        prev = line
+    return bytes(out)
+
+def recompressed_png_size(data):
+    """Estimate the smallest lossless re-encoding of a PNG.
+
+    Tries the original filtering at maximum deflate level with metadata
+    chunks dropped, and for 8-bit non-interlaced images also a palette
+    encoding when the image has at most 256 distinct colours. Fully
+    transparent pixels, including those matching a grey or RGB colour-key
+    tRNS, are treated as one colour since they render the same.
+    """
+    (width, height, depth, color, _, _, interlace), chunks = read_png(data)
+    kept = [(k, b) for k, b in chunks if k not in (b'IDAT', b'IEND') and k not in PNG_STRIP_CHUNKS]
+    raw = zlib.decompress(b''.join(b for k, b in chunks if k == b'IDAT'))
+    idat = zlib.compress(raw, 9)
+    best = png_size(kept + [(b'IDAT', idat), (b'IEND', b'')])
+
+    channels = PNG_CHANNELS.get(color)
+    if depth != 8 or interlace or channels is None:
+        return best
+    pixels = unfilter(raw, width, height, channels)
+    planes = [pixels[k::channels] for k in range(channels)]
+    if channels == 1:
+        planes = planes * 3
+    elif channels == 2:
+        planes = [planes[0]] * 3 + [planes[1]]
+    if len(planes) == 4:
+        colors = [c if c[3] else (0, 0, 0, 0) for c in zip(*planes)]
+    else:
+        # A colour-key tRNS holds one 16-bit sample per channel
+        key = b''.join(b for k, b in chunks if k == b'tRNS')
+        key = struct.unpack('>%dH' % (len(key) // 2), key) if key else None
+        if key and channels == 1:
+            key = key[:1] * 3
+        colors = [(0, 0, 0, 0) if c == key else c + (255,) for c in zip(*planes)]
+    palette = sorted(set(colors), key=lambda c: c[3])  # Transparent entries first
+    if len(palette) > 256:
+        return best
+
+    index = {c: i for i, c in enumerate(palette)}
+    indexed = bytes(index[c] for c in colors)
+    rows = b''.join(b'\0' + indexed[y * width:(y + 1) * width] for y in range(height))
+    header = struct.pack('>IIBBBBB', width, height, 8, 3, 0, 0, 0)
+    plte = b''.join(bytes(c[:3]) for c in palette)
+    alphas = bytes(c[3] for c in palette).rstrip(b'\xff')
+    # Keep sRGB, gAMA, cHRM, iCCP and the like so both estimates render the same
+    candidate = [(b'IHDR', header)]
+    candidate += [(k, b) for k, b in kept if k not in PNG_PALETTE_REBUILT_CHUNKS]
+    candidate.append((b'PLTE', plte))
+    if alphas:
+        candidate.append((b'tRNS', alphas))
+    candidate += [(b'IDAT', zlib.compress(rows, 9)), (b'IEND', b'')]
+    return min(best, png_size(candidate))
+
+def minified_svg_size(data):
+    """Estimate SVG size with comments, metadata and inter-tag whitespace removed."""
+    text = data.decode('utf-8', 'replace')
+    text = re.sub(r'<!--.*?-->', '', text, flags=re.S)
+    text = re.sub(r'<metadata\b.*?</metadata>', '', text, flags=re.S)
+    text = re.sub(r'>\s+<', '><', text)
+    return len(text.strip().encode('utf-8'))
+
+def load_cache(path):
+    """Return cached estimates by asset hash, or {} if made by another estimator."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+        return {}
+    return data.get('assets', {})
+
+def save_cache(path, cache):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({'version': CACHE_VERSION, 'assets': cache}, f, indent=2, sort_keys=True)
+
+def iter_images():
+    for root, dirs, files in os.walk(ROOT):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        for name in sorted(files):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                yield os.path.join(root, name)
+
+def analyze_images(referenced, cache):
+    """Return (duplicate groups, recompression suggestions) for repo images."""
+    by_hash = defaultdict(list)
+    for path in iter_images():
+        digest = sha256(path)
+        by_hash[digest].append(os.path.relpath(path, ROOT))
+        if digest not in cache:
+            with open(path, 'rb') as f:
+                data = f.read()
+            entry = {'size': len(data), 'optimized': len(data)}
+            try:
+                if path.lower().endswith('.png'):
+                    entry['optimized'] = min(len(data), recompressed_png_size(data))
+                elif path.lower().endswith('.svg'):
+                    entry['optimized'] = min(len(data), minified_svg_size(data))
+            except (ValueError, zlib.error, struct.error) as e:
+                entry['error'] = str(e)
+            cache[digest] = entry
+
+    duplicates, suggestions = [], []
+    for digest, paths in sorted(by_hash.items()):
+        entry = cache[digest]
+        used = [p for p in paths if os.path.join(ROOT, p) in referenced]
+        if len(paths) > 1:
+            duplicates.append({'paths': paths, 'size': entry['size'], 'referenced': used})
+        if entry['size'] - entry['optimized'] >= max(MIN_SAVING_BYTES, entry['size'] // 100):
+            suggestions.append({
+                'path': (used or paths)[0],
+                'size': entry['size'],
+                'optimized': entry['optimized'],
+                'referenced': bool(used),
+            })
+    return duplicates, suggestions
+
+def kb(n):
+    return '%.1f' % (n / 1024.0)
+
+def print_report(records, duplicates, suggestions, budget):
+    over = [r for r in records if r['total'] > budget]
+    print('%-58s %8s %8s %8s %8s %8s %9s' % (
+        'Page', 'MDX', 'Schema', 'Images', 'Site', 'Downl.', 'Total KB'))
+    for r in sorted(records, key=lambda r: -r['total']):
+        flag = ' !' if r['total'] > budget else ''
+        note = ' (missing)' if r.get('missing') else ''
+        if r['external_images']:
+            note += ' +%d remote image(s)' % r['external_images']
+        print('%-58s %8s %8s %8s %8s %8s %9s%s%s' % (
+            r['page'][:58], kb(r['mdx']), kb(r['schema']), kb(r['images']),
+            kb(r['site_assets']), kb(r['downloads']), kb(r['total']), flag, note))
+
+    print('\n%d of %d page(s) over the %s KB budget.' % (len(over), len(records), kb(budget)))
+
+    if duplicates:
+        print('\nDuplicate images (identical bytes):')
+        for d in duplicates:
+            keep = d['referenced'][0] if d['referenced'] else d['paths'][0]
+            extra = [p for p in d['paths'] if p != keep]
+            print('  %s (%s KB): keep %s, remove or re-point %s' % (
+                ', '.join(d['paths']), kb(d['size']), keep, ', '.join(extra)))
+
+    if suggestions:
+        print('\nLossless recompression:')
+        for s in sorted(suggestions, key=lambda s: s['optimized'] - s['size']):
+            saved = s['size'] - s['optimized']
+            print('  %-40s %8s KB -> %8s KB  (-%d%%)%s' % (
+                s['path'], kb(s['size']), kb(s['optimized']), 100 * saved // s['size'],
+                '' if s['referenced'] else '  [unreferenced]'))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_KB,
+                        help='page weight budget in KB (default: %d)' % DEFAULT_BUDGET_KB)
+    parser.add_argument('--count-downloads', action='store_true',
+                        help='include linked downloads in the page total')
+    parser.add_argument('--json', action='store_true', help='print a JSON report')
+    parser.add_argument('--cache', default=CACHE_FILE, help='image analysis cache file')
+    args = parser.parse_args()
+
+    with open(os.path.join(ROOT, 'docs.json')) as f:
+        config = json.load(f)
+    budget = int(args.budget * 1024)
+    records, referenced = analyze_pages(config, args.count_downloads)
+
+    cache = load_cache(args.cache)
+    duplicates, suggestions = analyze_images(referenced, cache)
+    save_cache(args.cache, cache)
+
+    if args.json:
+        json.dump({'budget': budget, 'pages': records, 'duplicates': duplicates,
+                   'recompression': suggestions}, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(records, duplicates, suggestions, budget)
+    return 1 if any(r['total'] > budget for r in records) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Split OpenAPI schemas into minified per-operation fragments.
+
+For every JSON schema used by an ``openapi`` group in docs.json (or the
+schemas given on the command line) this writes, under build/schemas/<name>/:
+
+    <operationId>.json   a standalone OpenAPI document with one operation and
+                         only the components it transitively references
+    <name>.min.json      a minified copy of the whole schema
+    index.json           operationId -> fragment file, method, path, hash
+
+Two operations that share an operationId, or whose names map to the same
+file, are an error. Nothing is written for that schema.
+
+Fragments are content-hashed. A fragment is rewritten only when its own
+operation or its reference closure changed. Fragments for removed
+operations are deleted.
+
+Nothing loads these fragments yet. docs.json still points at the full
+schemas, and build/ is not committed.
+
+Usage:
+    python3 scripts/split_schemas.py
+    python3 scripts/split_schemas.py api-reference/oapi-schemas/trading-schema.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+
+from page_weight import HTTP_METHODS, ROOT, openapi_source, repo_path
+
+OUTPUT_DIR = os.path.join(ROOT, 'build', 'schemas')
+
+# Top-level keys copied into every fragment as-is
+SHARED_KEYS = ('openapi', 'info', 'servers', 'security', 'externalDocs')
+
+def minify(document):
+    return json.dumps(document, separators=(',', ':'), ensure_ascii=False)
+
+def docs_schemas(node):
+    """Return every JSON schema source named by an ``openapi`` key in docs.json."""
+    sources = []
+    if isinstance(node, dict):
+        source = openapi_source(node.get('openapi'))
+        if source and source.endswith('.json'):
+            sources.append(source)
+        children = node.values()
+    elif isinstance(node, list):
+        children = node
+    else:
+        return sources
+    for child in children:
+        for source in docs_schemas(child):
+            if source not in sources:
+                sources.append(source)
+    return sources
+
+def iter_refs(node):
+    """Yield every $ref string inside a JSON value."""
+    if isinstance(node, dict):
+        ref = node.get('$ref')
+        if isinstance(ref, str):
+            yield ref
+        for value in node.values():
+            for ref in iter_refs(value):
+                yield ref
+    elif isinstance(node, list):
+        for value in node:
+            for ref in iter_refs(value):
+                yield ref
+
+def reference_closure(spec, root):
+    """Return {component kind: set of names} reachable from ``root``."""
+    components = spec.get('components', {})
+    closure = {}
+    pending = list(iter_refs(root))
+    while pending:
+        ref = pending.pop()
+        parts = ref.split('/')
+        if len(parts) != 4 or parts[:2] != ['#', 'components']:
+            continue  # External or non-component refs are left as they are
+        kind, name = parts[2], parts[3].replace('~1', '/').replace('~0', '~')
+        if name in closure.setdefault(kind, set()):
+            continue
+        if name not in components.get(kind, {}):
+            raise ValueError('Unresolved $ref: %s' % ref)
+        closure[kind].add(name)
+        pending.extend(iter_refs(components[kind][name]))
+    return closure
+
+def fragment_name(operation_id):
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', operation_id) + '.json'
+
+def split_schema(spec):
+    """Yield (operationId, method, path, fragment document) per operation."""
+    components = spec.get('components', {})
+    for route, item in spec.get('paths', {}).items():
+        shared = {k: v for k, v in item.items() if k not in HTTP_METHODS}
+        for method, operation in item.items():
+            if method not in HTTP_METHODS:
+                continue
+            operation_id = operation.get('operationId') or '%s_%s' % (
+                method, re.sub(r'\W+', '_', route).strip('_'))
+            path_item = dict(shared)
+            path_item[method] = operation
+            closure = reference_closure(spec, path_item)
+            if 'securitySchemes' in components:
+                closure.setdefault('securitySchemes', set()).update(components['securitySchemes'])
+
+            fragment = {k: spec[k] for k in SHARED_KEYS if k in spec}
+            if operation.get('tags') and 'tags' in spec:
+                fragment['tags'] = [t for t in spec['tags'] if t.get('name') in operation['tags']]
+            fragment['paths'] = {route: path_item}
+            if closure:
+                # Keep the source file's ordering so unchanged fragments hash the same
+                fragment['components'] = {
+                    kind: {n: v for n, v in members.items() if n in closure[kind]}
+                    for kind, members in components.items() if kind in closure
+                }
+            yield operation_id, method, route, fragment
+
+def write_if_changed(path, content):
+    """Write ``content`` unless the file already holds it; return True if written."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
+
+def build(source, output):
+    """Split one schema into ``output``; return (written, unchanged, removed)."""
+    with open(source, encoding='utf-8') as f:
+        spec = json.load(f)
+    name = os.path.splitext(os.path.basename(source))[0]
+    target = os.path.join(output, name)
+
+    index_path = os.path.join(target, 'index.json')
+    try:
+        with open(index_path, encoding='utf-8') as f:
+            previous = json.load(f).get('operations', {})
+    except (OSError, ValueError):
+        previous = {}
+
+    # Check every name before writing, so a clash cannot overwrite a fragment
+    fragments = list(split_schema(spec))
+    owners = {'index.json': 'the index', name + '.min.json': 'the minified schema'}
+    seen = set()
+    for operation_id, method, route, fragment in fragments:
+        if operation_id in seen:
+            raise ValueError('%s: duplicate operationId %r (%s %s)' % (
+                source, operation_id, method.upper(), route))
+        seen.add(operation_id)
+        filename = fragment_name(operation_id)
+        if filename in owners:
+            raise ValueError('%s: operationId %r and %s both map to %s' % (
+                source, operation_id, owners[filename], filename))
+        owners[filename] = 'operationId %r' % operation_id
+    os.makedirs(target, exist_ok=True)
+
+    operations = {}
+    written = unchanged = 0
+    for operation_id, method, route, fragment in fragments:
+        content = minify(fragment)
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        filename = fragment_name(operation_id)
+        path = os.path.join(target, filename)
+        old = previous.get(operation_id, {})
+        if old.get('sha256') == digest and old.get('fragment') == filename and os.path.isfile(path):
+            unchanged += 1
+        else:
+            write_if_changed(path, content)
+            written += 1
+        operations[operation_id] = {
+            'fragment': filename,
+            'method': method.upper(),
+            'path': route,
+            'bytes': len(content.encode('utf-8')),
+            'sha256': digest,
+        }
+
+    removed = 0
+    live = set(entry['fragment'] for entry in operations.values())
+    for entry in previous.values():
+        stale = os.path.join(target, entry.get('fragment', ''))
+        if entry.get('fragment') not in live and os.path.isfile(stale):
+            os.remove(stale)
+            removed += 1
+
+    write_if_changed(os.path.join(target, name + '.min.json'), minify(spec))
+    index = {
+        'source': os.path.relpath(source, ROOT),
+        'minified': name + '.min.json',
+        'operations': operations,
+    }
+    write_if_changed(index_path, json.dumps(index, indent=2, sort_keys=True) + '\n')
+    return written, unchanged, removed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('schemas', nargs='*',
+                        help='OpenAPI JSON files (default: every JSON schema in docs.json)')
+    parser.add_argument('-o', '--output', default=OUTPUT_DIR, help='output directory')
+    args = parser.parse_args()
+
+    sources = args.schemas
+    if not sources:
+        with open(os.path.join(ROOT, 'docs.json')) as f:
+            sources = [repo_path(s) for s in docs_schemas(json.load(f).get('navigation', {}))]
+
+    for source in sources:
+        written, unchanged, removed = build(source, args.output)
+        print('%s: %d fragment(s) written, %d unchanged, %d removed' % (
+            os.path.relpath(source, ROOT), written, unchanged, removed))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Check generated Word documents against committed golden outlines.
+
+Reads each .docx produced by generate_word_docs.py straight from the zip with
+a streaming XML parser, so python-docx is not needed. It reduces each
+document to an outline of headings, table rows and checkbox items, including
+the field ids of tagged cells. It then diffs the outline against
+scripts/golden/<name>.txt. Documents are checked in parallel.
+
+Usage:
+    python3 scripts/generate_word_docs.py && python3 scripts/verify_word_docs.py
+    python3 scripts/verify_word_docs.py --update   # accept the current outlines
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import difflib
+import os
+import re
+import sys
+import xml.etree.ElementTree as ET
+import zipfile
+
+from extract_form_data import PARAGRAPH, SDT, TAG, TEXT, VAL, W
+
+DOWNLOADS_DIR = os.path.join(os.path.dirname(__file__), '..', 'downloads')
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__), 'golden')
+
+DOCUMENTS = [
+    'onboarding-template.docx',
+    'corporate-application.docx',
+    'contact-form.docx',
+    'participant-agreement.docx',
+    'partner-onboarding-template.docx',
+]
+
+TABLE = W + 'tbl'
+ROW = W + 'tr'
+CELL = W + 'tc'
+STYLE = W + 'pStyle'
+
+HEADING_STYLE = re.compile(r'^(?:Title|Heading(\d))$')
+CHECKBOX = re.compile(r'^\[.?\]')
+
+def normalize(text):
+    return ' '.join(text.split())
+
+def with_tags(text, tags):
+    return normalize(' '.join([text] + ['{%s}' % t for t in tags]))
+
+def outline(path):
+    """Return the outline lines of one .docx file."""
+    lines = []
+    tables = 0          # Nesting depth of w:tbl
+    parts, style = [], None
+    tags, sdt_tags = [], []
+    row, cell = [], []
+    with zipfile.ZipFile(path) as docx:
+        with docx.open('word/document.xml') as stream:
+            for event, elem in ET.iterparse(stream, events=('start', 'end')):
+                tag = elem.tag
+                if event == 'start':
+                    if tag == TABLE:
+                        tables += 1
+                    elif tag == ROW:
+                        row = []
+                    elif tag == CELL:
+                        cell, tags = [], []
+                    elif tag == PARAGRAPH:
+                        parts, style = [], None
+                        if not tables:
+                            tags = []
+                    elif tag == SDT:
+                        sdt_tags.append(None)
+                    continue
+
+                if tag == TEXT:
+                    parts.append(elem.text or '')
+                elif tag == STYLE:
+                    style = elem.get(VAL)
+                elif tag == TAG and sdt_tags:
+                    sdt_tags[-1] = elem.get(VAL)
+                elif tag == SDT:
+                    field = sdt_tags.pop()
+                    if field:
+                        tags.append(field)
+                elif tag == PARAGRAPH:
+                    text = normalize(''.join(parts))
+                    if tables:
+                        if text:
+                            cell.append(text)
+                        continue
+                    heading = HEADING_STYLE.match(style or '')
+                    if heading:
+                        lines.append('H%s %s' % (heading.group(1) or '0', text))
+                    elif CHECKBOX.match(text):
+                        lines.append('CB ' + with_tags(text, tags))
+                    elem.clear()
+                elif tag == CELL:
+                    row.append(with_tags(' / '.join(cell), tags))
+                elif tag == ROW:
+                    lines.append(('T ' + ' | '.join(row)).rstrip())
+                elif tag == TABLE:
+                    tables -= 1
+                    if not tables:
+                        elem.clear()
+    return lines
+
+def golden_path(name):
+    return os.path.join(GOLDEN_DIR, os.path.splitext(name)[0] + '.txt')
+
+def check(args):
+    """Return (name, diff lines or None, error) for one document."""
+    name, directory, update = args
+    path = os.path.join(directory, name)
+    try:
+        lines = outline(path)
+    except (OSError, KeyError, zipfile.BadZipFile, ET.ParseError) as e:
+        return name, None, str(e)
+    actual = [line + '\n' for line in lines]
+    if update:
+        with open(golden_path(name), 'w', encoding='utf-8') as f:
+            f.writelines(actual)
+        return name, [], None
+    try:
+        with open(golden_path(name), encoding='utf-8') as f:
+            expected = f.readlines()
+    except OSError as e:
+        return name, None, 'no golden outline (%s); run with --update' % e.strerror
+    golden = 'golden/' + os.path.basename(golden_path(name))
+    diff = list(difflib.unified_diff(expected, actual, golden, name))
+    return name, diff, None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--dir', default=DOWNLOADS_DIR, help='directory with the generated .docx files')
+    parser.add_argument('--update', action='store_true', help='rewrite the golden outlines')
+    args = parser.parse_args()
+
+    if args.update:
+        os.makedirs(GOLDEN_DIR, exist_ok=True)
+    failed = 0
+    with ProcessPoolExecutor(max_workers=len(DOCUMENTS)) as pool:
+        jobs = [(name, args.dir, args.update) for name in DOCUMENTS]
+        for name, diff, error in pool.map(check, jobs):
+            if error:
+                failed += 1
+                print('%s: %s' % (name, error))
+            elif diff:
+                failed += 1
+                sys.stdout.writelines(diff)
+            else:
+                print('%s: %s' % (name, 'updated' if args.update else 'ok'))
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())